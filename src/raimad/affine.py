@@ -91,6 +91,49 @@ def transform_xyarray(
 
     return euclidean
 
+def transform_xyarrays(
+        matrix: 'rai.typing.Affine',
+        xyarrays: 'rai.typing.Polys',
+        ) -> 'list[rai.typing.PolyArray]':
+    """
+    Apply transformation to many xyarrays at once
+    and return a list of new transformed xyarrays.
+
+    All points are stacked into one array and transformed
+    with a single matrix multiplication,
+    which is much faster than transforming each xyarray separately
+    when there are many small polygons.
+    """
+    if len(xyarrays) == 0:
+        return []
+
+    arrays = [
+        np.asarray(xyarray, dtype=np.float64).reshape(-1, 2)
+        for xyarray in xyarrays
+        ]
+
+    # Most layers hold a lone xyarray,
+    # for which stacking and splitting again would cost more than it saves
+    stacked = arrays[0] if len(arrays) == 1 else np.concatenate(arrays)
+
+    if matrix[2, 0] == 0 and matrix[2, 1] == 0 and matrix[2, 2] == 1:
+        # Not a projective transform,
+        # so there is no need to go through homogeneous coordinates
+        transformed = stacked @ matrix[:2, :2].T + matrix[:2, 2]
+    else:
+        transformed = transform_xyarray(matrix, stacked)
+
+    if len(arrays) == 1:
+        return [transformed]
+
+    split = []
+    start = 0
+    for array in arrays:
+        end = start + len(array)
+        split.append(transformed[start:end])
+        start = end
+    return split
+
 def transform_point(
         matrix: 'rai.typing.Affine',
         point: 'rai.typing.Point'
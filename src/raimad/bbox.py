@@ -1,6 +1,8 @@
 """BBox.py: contains BBox class and relevant Exceptions."""
 
 from typing import List
+import math
+import operator
 
 try:
     from typing import Self
@@ -25,14 +27,84 @@ class EmptyBBoxError(Exception):
     do not make sense, and attempting to query them will raise this exception.
     """
 
+# X and Y ratios of the named points of a bbox,
+# in the same order as the `BBox._corners` cache.
+_CORNER_RATIOS = np.array([
+    [0.5, 0.5],  # mid
+    [0.5, MATHEMATIC_Y_AXIS],  # top_mid
+    [0.5, not MATHEMATIC_Y_AXIS],  # bot_mid
+    [0, 0.5],  # mid_left
+    [1, 0.5],  # mid_right
+    [0, MATHEMATIC_Y_AXIS],  # top_left
+    [1, MATHEMATIC_Y_AXIS],  # top_right
+    [0, not MATHEMATIC_Y_AXIS],  # bot_left
+    [1, not MATHEMATIC_Y_AXIS],  # bot_right
+    ])
+
+# Above this many points, `BBox.add_xyarrays` reduces each xyarray
+# separately instead of concatenating them first.
+_CONCAT_MAX_POINTS = 1_000_000
+
+def _extremum(slot: str, doc: str) -> property:
+    """Make a property that reads and writes one of the extrema slots."""
+
+    def setter(self: 'BBox', value: float) -> None:
+        setattr(self, slot, value)
+        self._ext = None
+        self._corners = None
+        # Extrema are normally only ever set together,
+        # but someone assigning them by hand may fill them in one by one
+        self._populated = math.inf not in (
+            abs(self._min_x),
+            abs(self._min_y),
+            abs(self._max_x),
+            abs(self._max_y),
+            )
+
+    return property(operator.attrgetter(slot), setter, doc=doc)
+
 class BBox(object):
     """
     """
 
-    max_x: float
-    max_y: float
-    min_x: float
-    min_y: float
+    # Bboxes are created for every compo and proxy that gets asked
+    # for one, so keep instances small
+    __slots__ = (
+        '_min_x',
+        '_min_y',
+        '_max_x',
+        '_max_y',
+        '_ext',
+        '_corners',
+        '_populated',
+        '_proxy',
+        )
+
+    # The extrema are kept as plain Python numbers,
+    # since `add_point` and `pad` only ever touch them one at a time,
+    # and that is much cheaper than going through a numpy array.
+    _min_x: float
+    _min_y: float
+    _max_x: float
+    _max_y: float
+
+    # Lazily built read-only array of [min_x, min_y, max_x, max_y]
+    # (see `_array`).
+    # Reset to None whenever the extrema change.
+    _ext: np.ndarray | None
+
+    # Lazily computed named points (see `_CORNER_RATIOS`).
+    # Reset to None whenever the extrema change.
+    _corners: np.ndarray | None
+
+    # Whether any points have been added,
+    # so emptiness checks don't need to look at the extrema
+    _populated: bool
+
+    min_x = _extremum('_min_x', "Smallest X coordinate in the bbox.")
+    min_y = _extremum('_min_y', "Smallest Y coordinate in the bbox.")
+    max_x = _extremum('_max_x', "Largest X coordinate in the bbox.")
+    max_y = _extremum('_max_y', "Largest Y coordinate in the bbox.")
 
     def __init__(
             self,
@@ -51,10 +123,13 @@ class BBox(object):
             The proxy that this bbox should be bound to.
             This is optional.
         """
-        self.max_x = float('-inf')
-        self.max_y = float('-inf')
-        self.min_x = float('inf')
-        self.min_y = float('inf')
+        self._min_x = math.inf
+        self._min_y = math.inf
+        self._max_x = -math.inf
+        self._max_y = -math.inf
+        self._ext = None
+        self._corners = None
+        self._populated = False
         self._proxy = proxy
 
         if xyarray is not None:
@@ -65,11 +140,45 @@ class BBox(object):
 
     def as_list(self) -> List[float]:
         """Return as list of [min_x, min_y, max_x, max_y]."""
-        return [self.min_x, self.min_y, self.max_x, self.max_y]
+        return [self._min_x, self._min_y, self._max_x, self._max_y]
+
+    def _array(self) -> np.ndarray:
+        """
+        Get a read-only array of [min_x, min_y, max_x, max_y].
+
+        The array is built the first time it is needed
+        and reused until the extrema change.
+        """
+        if self._ext is None:
+            # No dtype is forced,
+            # so that integer extrema give an integer array like they used to
+            ext = np.array(self.as_list())
+            ext.flags.writeable = False
+            self._ext = ext
+        return self._ext
 
-    def __array__(self) -> np.ndarray:
-        """Return as numpy array of [min_x, min_y, max_x, max_y]."""
-        return np.array(self.as_list())
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        """
+        Return as numpy array of [min_x, min_y, max_x, max_y].
+
+        Unless a copy is requested (e.g. by `np.array(bbox)`),
+        this returns a read-only array that the bbox keeps around
+        until its extrema change,
+        so repeated `np.asarray(bbox)` calls do not allocate.
+        """
+        ext = self._array()
+
+        if dtype is not None and np.dtype(dtype) != ext.dtype:
+            if copy is False:
+                # Per the numpy `__array__` protocol
+                raise ValueError(
+                    "Converting a bbox to a different dtype requires a copy"
+                    )
+            return ext.astype(dtype)
+
+        if copy:
+            return ext.copy()
+        return ext
 
     def __iter__(self):
         """Return as iter of [min_x, min_y, max_x, max_y]."""
@@ -93,12 +202,7 @@ class BBox(object):
 .5        -------
         BBox.assert_nonempty()
         """
-        return (
-            self.max_x == float('-inf') or
-            self.max_y == float('-inf') or
-            self.min_x == float('inf') or
-            self.min_y == float('inf')
-            )
+        return not self._populated
 
     def assert_nonempty(self, *args, **kwargs) -> None:
         """
@@ -127,10 +231,14 @@ class BBox(object):
         # TODO read up on how to properly do copies
         # in Python
         new_bbox = BBox()
-        new_bbox.max_x = self.max_x
-        new_bbox.max_y = self.max_y
-        new_bbox.min_x = self.min_x
-        new_bbox.min_y = self.min_y
+        new_bbox._min_x = self._min_x
+        new_bbox._min_y = self._min_y
+        new_bbox._max_x = self._max_x
+        new_bbox._max_y = self._max_y
+        # Both caches are never written to in place, so they can be shared
+        new_bbox._ext = self._ext
+        new_bbox._corners = self._corners
+        new_bbox._populated = self._populated
         return new_bbox
 
     def add_xyarray(self, xyarray: 'rai.typing.Poly') -> None:
@@ -142,8 +250,59 @@ class BBox(object):
         xyarray: np.ndarray
             A N x 2 numpy array containing points to add to the bbox.
         """
-        for point in xyarray:
-            self.add_point(point)
+        if len(xyarray) == 0:
+            return
+
+        # Reduce the whole array at once instead of
+        # calling `add_point` for every row
+        xyarray = np.asarray(xyarray)
+        min_x, min_y = xyarray.min(axis=0).tolist()
+        max_x, max_y = xyarray.max(axis=0).tolist()
+        self._min_x = min(self._min_x, min_x)
+        self._min_y = min(self._min_y, min_y)
+        self._max_x = max(self._max_x, max_x)
+        self._max_y = max(self._max_y, max_y)
+        self._ext = None
+        self._corners = None
+        self._populated = True
+
+    def add_xyarrays(self, xyarrays: 'rai.typing.Polys') -> None:
+        """
+        Add the points of many xyarrays to the bounding box.
+
+        This is equivalent to calling `add_xyarray` on every xyarray,
+        but the points are reduced in one pass.
+        For small inputs, all points are concatenated and reduced at once.
+        Above `_CONCAT_MAX_POINTS` points,
+        or if the xyarrays mix integer and float coordinates,
+        each xyarray is reduced separately instead,
+        to avoid allocating one huge array,
+        or casting integer extrema to floats.
+
+        Parameters
+        ----------
+        xyarrays: list[np.ndarray]
+            A list of N x 2 numpy arrays containing points to add to the bbox.
+        """
+        arrays = [
+            np.asarray(xyarray).reshape(-1, 2)
+            for xyarray in xyarrays
+            if len(xyarray) != 0
+            ]
+
+        if not arrays:
+            return
+
+        dtype = arrays[0].dtype
+        if (
+                sum(len(array) for array in arrays) <= _CONCAT_MAX_POINTS
+                and all(array.dtype == dtype for array in arrays)
+                ):
+            self.add_xyarray(np.concatenate(arrays))
+            return
+
+        for array in arrays:
+            self.add_xyarray(array)
 
     def add_point(self, point):
         """
@@ -154,16 +313,25 @@ class BBox(object):
         point
             the point to add
         """
-        # TODO simplify with ELIFs?
-        if point[0] > self.max_x:
-            self.max_x = point[0]
-        if point[0] < self.min_x:
-            self.min_x = point[0]
-
-        if point[1] > self.max_y:
-            self.max_y = point[1]
-        if point[1] < self.min_y:
-            self.min_y = point[1]
+        x, y = point[0], point[1]
+        changed = False
+        if x < self._min_x:
+            self._min_x = x
+            changed = True
+        if y < self._min_y:
+            self._min_y = y
+            changed = True
+        if x > self._max_x:
+            self._max_x = x
+            changed = True
+        if y > self._max_y:
+            self._max_y = y
+            changed = True
+
+        if changed:
+            self._ext = None
+            self._corners = None
+            self._populated = True
 
     @property
     def length(self) -> float:
@@ -180,7 +348,9 @@ class BBox(object):
         float
             length of the bbox
         """
-        self.assert_nonempty("Tried to get length of empty bbox.")
+        if not self._populated:
+            raise EmptyBBoxError("Tried to get length of empty bbox.")
+
         return self.max_x - self.min_x
 
     @property
@@ -198,7 +368,9 @@ class BBox(object):
         float
             width of the bbox
         """
-        self.assert_nonempty("Tried to get width of empty bbox.")
+        if not self._populated:
+            raise EmptyBBoxError("Tried to get width of empty bbox.")
+
         return self.max_y - self.min_y
 
     @property
@@ -216,7 +388,9 @@ class BBox(object):
         float
             left X ccordinate of the bbox
         """
-        self.assert_nonempty("Tried to get left of empty bbox.")
+        if not self._populated:
+            raise EmptyBBoxError("Tried to get left of empty bbox.")
+
         return self.min_x
 
     @property
@@ -234,7 +408,9 @@ class BBox(object):
         float
             top Y coordinate of the bbox
         """
-        self.assert_nonempty("Tried to get top of empty bbox.")
+        if not self._populated:
+            raise EmptyBBoxError("Tried to get top of empty bbox.")
+
         return self.max_y if MATHEMATIC_Y_AXIS else self.min_y
 
     @property
@@ -252,7 +428,9 @@ class BBox(object):
         float
             right X coordinate of the bbox
         """
-        self.assert_nonempty("Tried to get right of empty bbox.")
+        if not self._populated:
+            raise EmptyBBoxError("Tried to get right of empty bbox.")
+
         return self.max_x
 
     @property
@@ -270,7 +448,9 @@ class BBox(object):
         float
             bottom Y of the bbox
         """
-        self.assert_nonempty("Tried to get bottom of empty bbox.")
+        if not self._populated:
+            raise EmptyBBoxError("Tried to get bottom of empty bbox.")
+
         return self.min_y if MATHEMATIC_Y_AXIS else self.max_y
 
     def interpolate(
@@ -307,14 +487,52 @@ class BBox(object):
             A regular rai.Point for unbound bboxes,
             and a rai.BoundPoint for bound bboxes.
         """
-        x = self.min_x + self.length * x_ratio
-        y = self.min_y + self.width * y_ratio
+        if self.is_empty():
+            raise EmptyBBoxError("Tried to interpolate empty bbox")
+
+        # Read the extrema once instead of going through
+        # `length` and `width`, which would each check emptiness again
+        min_x = self._min_x
+        min_y = self._min_y
+        x = min_x + (self._max_x - min_x) * x_ratio
+        y = min_y + (self._max_y - min_y) * y_ratio
 
         if self._proxy is None:
             return np.array([x, y])
         else:
             return rai.BoundPoint((x, y), proxy=self._proxy)
 
+    def _corner(self, index: int):
+        """
+        Get one of the named points of the bbox.
+
+        All named points are computed together the first time
+        one of them is needed, and reused until the extrema change.
+        This does not check whether the bbox is empty,
+        callers are expected to check `_populated` first.
+
+        Parameters
+        ----------
+        index: int
+            Row of `_CORNER_RATIOS` to get.
+
+        Returns
+        -------
+        rai.Point | pc.BoundPoint
+            A regular rai.Point for unbound bboxes,
+            and a rai.BoundPoint for bound bboxes.
+        """
+        if self._corners is None:
+            ext = self._array()
+            self._corners = ext[:2] + (ext[2:] - ext[:2]) * _CORNER_RATIOS
+
+        point = self._corners[index].copy()
+
+        if self._proxy is None:
+            return point
+        else:
+            return rai.BoundPoint(point, proxy=self._proxy)
+
     @property
     def mid(self):
         """
@@ -338,8 +556,10 @@ class BBox(object):
             A regular rai.Point for unbound bboxes,
             and a rai.BoundPoint for bound bboxes.
         """
-        self.assert_nonempty("Tried to get middle point of empty bbox")
-        return self.interpolate(0.5, 0.5)
+        if not self._populated:
+            raise EmptyBBoxError("Tried to get middle point of empty bbox")
+
+        return self._corner(0)
 
     @property
     def top_mid(self):
@@ -364,8 +584,10 @@ class BBox(object):
             A regular rai.Point for unbound bboxes,
             and a rai.BoundPoint for bound bboxes.
         """
-        self.assert_nonempty("Tried to get top middle point of empty bbox")
-        return self.interpolate(0.5, MATHEMATIC_Y_AXIS)
+        if not self._populated:
+            raise EmptyBBoxError("Tried to get top middle point of empty bbox")
+
+        return self._corner(1)
 
     @property
     def bot_mid(self):
@@ -390,8 +612,10 @@ class BBox(object):
             A regular rai.Point for unbound bboxes,
             and a rai.BoundPoint for bound bboxes.
         """
-        self.assert_nonempty("Tried to get bottom middle point of empty bbox")
-        return self.interpolate(0.5, not MATHEMATIC_Y_AXIS)
+        if not self._populated:
+            raise EmptyBBoxError("Tried to get bottom middle point of empty bbox")
+
+        return self._corner(2)
 
     @property
     def mid_left(self):
@@ -416,8 +640,10 @@ class BBox(object):
             A regular rai.Point for unbound bboxes,
             and a rai.BoundPoint for bound bboxes.
         """
-        self.assert_nonempty("Tried to get middle left point of empty bbox")
-        return self.interpolate(0, 0.5)
+        if not self._populated:
+            raise EmptyBBoxError("Tried to get middle left point of empty bbox")
+
+        return self._corner(3)
 
     @property
     def mid_right(self):
@@ -442,8 +668,10 @@ class BBox(object):
             A regular rai.Point for unbound bboxes,
             and a rai.BoundPoint for bound bboxes.
         """
-        self.assert_nonempty("Tried to get middle right point of empty bbox")
-        return self.interpolate(1, 0.5)
+        if not self._populated:
+            raise EmptyBBoxError("Tried to get middle right point of empty bbox")
+
+        return self._corner(4)
 
     @property
     def top_left(self):
@@ -468,8 +696,10 @@ class BBox(object):
             A regular rai.Point for unbound bboxes,
             and a rai.BoundPoint for bound bboxes.
         """
-        self.assert_nonempty("Tried to get top left point of empty bbox")
-        return self.interpolate(0, MATHEMATIC_Y_AXIS)
+        if not self._populated:
+            raise EmptyBBoxError("Tried to get top left point of empty bbox")
+
+        return self._corner(5)
 
     @property
     def top_right(self):
@@ -494,8 +724,10 @@ class BBox(object):
             A regular rai.Point for unbound bboxes,
             and a rai.BoundPoint for bound bboxes.
         """
-        self.assert_nonempty("Tried to get top right point of empty bbox")
-        return self.interpolate(1, MATHEMATIC_Y_AXIS)
+        if not self._populated:
+            raise EmptyBBoxError("Tried to get top right point of empty bbox")
+
+        return self._corner(6)
 
     @property
     def bot_left(self):
@@ -520,8 +752,10 @@ class BBox(object):
             A regular rai.Point for unbound bboxes,
             and a rai.BoundPoint for bound bboxes.
         """
-        self.assert_nonempty("Tried to get bottom left point of empty bbox")
-        return self.interpolate(0, not MATHEMATIC_Y_AXIS)
+        if not self._populated:
+            raise EmptyBBoxError("Tried to get bottom left point of empty bbox")
+
+        return self._corner(7)
 
     @property
     def bot_right(self):
@@ -546,8 +780,10 @@ class BBox(object):
             A regular rai.Point for unbound bboxes,
             and a rai.BoundPoint for bound bboxes.
         """
-        self.assert_nonempty("Tried to get bottom right point of empty bbox")
-        return self.interpolate(1, not MATHEMATIC_Y_AXIS)
+        if not self._populated:
+            raise EmptyBBoxError("Tried to get bottom right point of empty bbox")
+
+        return self._corner(8)
 
     def pad(
             self,
@@ -597,15 +833,23 @@ class BBox(object):
         Self
             A new bbox with the corresponding padding.
         """
-        self.assert_nonempty("Tried to pad empty bbox")
+        if not self._populated:
+            raise EmptyBBoxError("Tried to pad empty bbox")
 
         y = y or x
 
-        new = self.copy()
-        new.min_x -= left + x
-        new.max_x += right + x
-        new.min_y -= bottom + y
-        new.max_y += top + y
+        # Fill in a bare bbox directly,
+        # rather than copying this one and then
+        # going through the property setters once for every side
+        new = BBox.__new__(BBox)
+        new._min_x = self._min_x - (left + x)
+        new._min_y = self._min_y - (bottom + y)
+        new._max_x = self._max_x + (right + x)
+        new._max_y = self._max_y + (top + y)
+        new._ext = None
+        new._corners = None
+        new._populated = True
+        new._proxy = None
 
         return new
 
@@ -101,16 +101,18 @@ def _check_compo(compo, tree):
             ),
         )""", True)
 
+    # Build the set of declared marks once,
+    # rather than a new list for every assignment
+    declared_marks = {mark.name for mark in compo.Marks.values()}
+
     redundancy = {}
     for assign in mark_assigns:
         mark_name = assign.attr
 
-        if mark_name not in [mark.name for mark in compo.Marks.values()]:
+        if mark_name not in declared_marks:
             yield rai.RAI442(assign, mark=mark_name)
 
-        if mark_name not in redundancy.keys():
-            redundancy[mark_name] = []
-        redundancy[mark_name].append(assign)
+        redundancy.setdefault(mark_name, []).append(assign)
 
     # TODO how to deal with multiple asignment
     # that's not actually multiple asignment
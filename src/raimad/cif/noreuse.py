@@ -1,3 +1,5 @@
+import numpy as np
+
 class NoReuse:
     def __init__(self, compo, multiplier=1e3):
         self.compo = compo
@@ -30,17 +32,32 @@ class NoReuse:
         # advance to next routine number
         self.rout_num += 1
 
-        # Export all geometries
+        # Export all geometries.
+        # Each polygon is scaled and truncated to integers in one go
+        # and emitted as a single line,
+        # rather than formatting and yielding every point separately.
+        multiplier = self.multiplier
         for layer, geom in compo.geoms.items():
             yield f'\tL L{layer};\n'
             for poly in geom:
-                yield '\tP '
-                for point in poly:
-                    yield (
-                        f'{int(point[0] * self.multiplier)} '
-                        f'{int(point[1] * self.multiplier)} '
-                        )
-                yield ';\n'
+                if len(poly) == 0:
+                    yield '\tP ;\n'
+                    continue
+
+                scaled = np.asarray(poly) * multiplier
+                if (
+                        scaled.dtype.kind == 'f'
+                        and not (np.abs(scaled) < 2 ** 63).all()
+                        ):
+                    # NaN, inf, or too big for int64.
+                    # Fall back to `int`, which raises on the first two
+                    # and stays exact for the last one,
+                    # instead of letting `astype` make up garbage.
+                    coords = [int(value) for value in scaled.ravel().tolist()]
+                else:
+                    coords = scaled.astype(np.int64).ravel().tolist()
+
+                yield f'\tP {" ".join(map(str, coords))} ;\n'
 
         # Precompute a list of [routine number, subcomponent]
         # Remember, subcomponents can also have subcomponents,
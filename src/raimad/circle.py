@@ -1,6 +1,20 @@
+from functools import lru_cache
+
 import numpy as np
 import raimad as rai
 
+@lru_cache(maxsize=128)
+def _circle_xyarray(radius: float, num_points: int) -> np.ndarray:
+    """
+    Compute the points of a circle approximation.
+    Circles with the same radius and number of points are very common
+    (think arrays of identical holes on a chip),
+    so the result is cached.
+    Don't mutate the returned array, copy it instead.
+    """
+    angles = np.linspace(0, 2 * np.pi, num_points)
+    return np.column_stack((np.cos(angles), np.sin(angles))) * radius
+
 class Circle(rai.Compo):
     """
     Circle
@@ -18,13 +32,8 @@ class Circle(rai.Compo):
 
         self.geoms.update({
             'root': [
-                np.array([
-                    rai.polar(angle, radius)
-                    for angle
-                    in np.linspace(0, 2 * np.pi, num_points)
-                    ])
+                _circle_xyarray(radius, num_points).copy()
                 ]
             })
 
         self.marks.center = (0, 0)
-
@@ -1,4 +1,6 @@
 import inspect
+import sys
+from collections import defaultdict
 
 try:
     from typing import Self
@@ -6,16 +8,21 @@ except ImportError:
     # py3.10 and lower
     from typing_extensions import Self
 
-from copy import deepcopy
-
 import raimad as rai
 
 class MarksContainer(rai.DictList):
+    __slots__ = ('_proxy', )
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._proxy = None
 
     def __getattr__(self, name):
+        if name.startswith('_'):
+            # Private and dunder lookups (`__deepcopy__`, `_repr_html_`,
+            # ...) that got here are never marks,
+            # so don't send them through the proxy
+            raise AttributeError(name)
 
         if self._proxy is None:
             return self[name]
@@ -59,14 +66,7 @@ class Compo:
         Steamroll the entire compo hierarchy into one Geoms dict
         TODO more informative
         """
-        geoms = self.geoms.copy()
-        for subcompo in self.subcompos.values():
-            # TODO override "update" method in geoms container?
-            for layer_name, layer_geoms in subcompo.steamroll().items():
-                if layer_name not in geoms.keys():
-                    geoms[layer_name] = []
-                geoms[layer_name].extend(layer_geoms)
-        return geoms
+        return _steamroll(self)
 
     def final(self):
         return self
@@ -91,9 +91,24 @@ class Compo:
         return NotImplemented
 
     def walk_hier(self):
-        yield self
-        for subcompo in self.subcompos.values():
-            yield from subcompo.walk_hier()
+        # Walk with an explicit stack rather than
+        # recursing through `Proxy.walk_hier` at every level.
+        # Entries are (compo, proxies leading to it, outermost first)
+        stack = [(self, ())]
+        while stack:
+            compo, proxies = stack.pop()
+
+            node = compo
+            for proxy in reversed(proxies):
+                node = proxy.copy_reassign(node)
+            yield node
+
+            for subcompo in reversed(compo.subcompos.values()):
+                chain = proxies
+                while isinstance(subcompo, rai.Proxy):
+                    chain = (*chain, subcompo)
+                    subcompo = subcompo.compo
+                stack.append((subcompo, chain))
 
     # Transform functions #
     # TODO for all transforms
@@ -148,9 +163,11 @@ class Compo:
     @property
     def bbox(self):
         bbox = rai.BBox()
-        for geoms in self.steamroll().values():
-            for geom in geoms:
-                bbox.add_xyarray(geom)
+        bbox.add_xyarrays([
+            geom
+            for geoms in self.steamroll().values()
+            for geom in geoms
+            ])
         return bbox
 
     def __init_subclass__(cls):
@@ -158,22 +175,24 @@ class Compo:
         _class_to_dictlist(cls, 'Layers', rai.Layer)
         _class_to_dictlist(cls, 'Options', rai.Option)
 
+        options = cls.Options
         for param in inspect.signature(cls._make).parameters.values():
-            if param.name not in cls.Options.keys():
+            option = options.get(param.name)
+            if option is None:
                 # TODO unannotated
                 continue
 
-            cls.Options[param.name].annot = rai.Empty
-            cls.Options[param.name].default = rai.Empty
+            option.annot = rai.Empty
+            option.default = rai.Empty
 
             if param.default is not inspect._empty:
-                cls.Options[param.name].default = param.default
+                option.default = param.default
 
             if param.annotation is inspect._empty:
                 if param.default is not inspect._empty:
-                    cls.Options[param.name].annot = type(param.default)
+                    option.annot = type(param.default)
             else:
-                cls.Options[param.name].annot = param.annotation
+                option.annot = param.annotation
 
     # Condemned method, I don't like it
     #def subcompo(self, compo, name: str | None = None):
@@ -191,8 +210,11 @@ class Compo:
         call this from as subcompos using some arcane stack inspection
         hackery.
         """
-        # Get all local variables in the above frame
-        locs = locs or inspect.stack()[1].frame.f_locals
+        # Get all local variables in the above frame.
+        # `sys._getframe` grabs just that one frame,
+        # whereas `inspect.stack` would build FrameInfo
+        # (with source context) for every frame on the stack.
+        locs = locs or sys._getframe(1).f_locals
 
         for name, obj in locs.items():
             if (
@@ -235,3 +257,55 @@ def _class_to_dictlist(cls, attr, wanted_type):
 
     setattr(cls, attr, new_list)
 
+def _steamroll(root: 'rai.typing.Compo') -> 'rai.typing.Geoms':
+    """
+    Steamroll the hierarchy under a compo or proxy into one Geoms dict.
+
+    The hierarchy is walked with an explicit stack instead of recursion.
+    Transforms are composed on the way down,
+    so every geom is transformed exactly once, by its flattened transform,
+    instead of once for every proxy above it.
+    """
+    geoms: 'defaultdict[str, list]' = defaultdict(list)
+
+    # Entries are (compo or proxy, flattened transform of everything above,
+    # lmaps of everything above, innermost first)
+    stack = [(root, None, ())]
+    while stack:
+        compo, transform, lmaps = stack.pop()
+
+        if isinstance(compo, rai.Proxy):
+            stack.append((
+                compo.compo,
+                # Only ever read from below, so no need to copy
+                # when there is nothing to compose with
+                (
+                    compo.transform
+                    if transform is None
+                    else compo.transform.copy().compose(transform)
+                    ),
+                # Identity lmaps would only cost a lookup per layer
+                lmaps if compo.lmap.is_identity() else (compo.lmap, *lmaps),
+                ))
+            continue
+
+        for layer_name, layer_geoms in compo.geoms.items():
+            for lmap in lmaps:
+                layer_name = lmap[layer_name]
+
+            if transform is not None:
+                # Anything below a proxy gets new arrays,
+                # even through identity transforms,
+                # so callers can't edit subcompo geoms through the result.
+                # The root compo's own geoms are passed through as they are.
+                layer_geoms = transform.transform_xyarrays(layer_geoms)
+
+            geoms[layer_name].extend(layer_geoms)
+
+        # Reversed, so that subcompos get popped in order
+        stack.extend(
+            (subcompo, transform, lmaps)
+            for subcompo in reversed(compo.subcompos.values())
+            )
+
+    return dict(geoms)
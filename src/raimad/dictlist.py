@@ -23,6 +23,8 @@ class DictList(Generic[T]):
     """
     _dict: dict[str | int, T]
 
+    __slots__ = ('_dict', )
+
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self._dict = dict(*args, **kwargs)
 
@@ -74,6 +76,9 @@ class DictList(Generic[T]):
     def keys(self) -> KeysView[str | int]:
         return self._dict.keys()
 
+    def get(self, key: str | int, default: Any = None) -> T | Any:
+        return self._dict.get(key, default)
+
     def __len__(self) -> int:
         return self._dict.__len__()
 
@@ -72,14 +72,22 @@ def flatten(iterable: Iterable) -> Iterable:
     """
 
     if not isinstance(iterable, Iterable) or isinstance(iterable, str):
-        # This terminates the recursion
         return [iterable]
 
-    return [
-        item
-        for sub in iterable
-        for item in flatten(sub)
-        ]
+    # Walk the nesting with an explicit stack of iterators
+    # instead of recursing into every nested iterable
+    flat = []
+    stack = [iter(iterable)]
+    while stack:
+        for item in stack[-1]:
+            if isinstance(item, Iterable) and not isinstance(item, str):
+                stack.append(iter(item))
+                break
+            flat.append(item)
+        else:
+            stack.pop()
+
+    return flat
 
 
 def braid(*iterables) -> Iterable:
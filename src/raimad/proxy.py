@@ -1,4 +1,5 @@
 from typing import Iterator, Any
+from collections import defaultdict
 
 try:
     from typing import Self
@@ -6,11 +7,11 @@ except ImportError:
     # py3.10 and lower
     from typing_extensions import Self
 
-from copy import copy
-
 import raimad as rai
 
 class LMap:
+    __slots__ = ('shorthand', )
+
     def __init__(self, shorthand: 'rai.typing.LMapShorthand') -> None:
         self.shorthand = shorthand
 
@@ -28,8 +29,16 @@ class LMap:
     # TODO hacky
 
     def copy(self) -> Self:
+        # The shorthand is never modified in place,
+        # so copies can share it instead of copying the dict
         return type(self)(self.shorthand)
 
+    def is_identity(self) -> bool:
+        """
+        Check whether this lmap passes every layer through unchanged
+        """
+        return self.shorthand is None
+
     def compose(self, other: Self) -> Self:
         if other.shorthand is None:
             # None lmap, pass everything through
@@ -40,16 +49,17 @@ class LMap:
             self.shorthand = other.shorthand
 
         elif isinstance(other.shorthand, dict):
-            # TODO better way to do this?
+            # Shorthand dicts are shared between copies of an lmap
+            # (see `copy`), so build a new dict instead of
+            # modifying this one in place.
             if isinstance(self.shorthand, dict):
-                for self_k, self_val in tuple(self.shorthand.items()):
-                    try:
-                        self.shorthand[self_k] = other[self_val]
-                    except KeyError:
-                        pass
+                self.shorthand = {
+                    self_k: other.shorthand.get(self_val, self_val)
+                    for self_k, self_val in self.shorthand.items()
+                    }
 
             elif self.shorthand is None:
-                self.shorthand = copy(other.shorthand)
+                self.shorthand = other.shorthand
 
             elif isinstance(self.shorthand, str):
                 self.shorthand = other[self.shorthand]
@@ -62,6 +72,17 @@ class LMap:
 class Proxy:
     compo: 'rai.typing.Compo'
 
+    # Proxies are made for every subcompo, and new ones are made
+    # every time `subcompos` or `walk_hier` is accessed on a proxy
+    __slots__ = (
+        '_cif_linked',
+        '_cif_link',
+        '_autogen',
+        'compo',
+        'lmap',
+        'transform',
+        )
+
     def __init__(self,
                  compo: 'rai.typing.Compo',
                  lmap: 'rai.typing.LMapShorthand' = None,
@@ -77,14 +98,26 @@ class Proxy:
         self.transform = transform or rai.Transform()
 
     def steamroll(self) -> 'rai.typing.Geoms':
-        return {
-            self.lmap[layer]: [
-                self.transform.transform_xyarray(geom)
-                for geom in geoms
-                ]
-            for layer, geoms
-            in self.compo.steamroll().items()
-            }
+        return rai.compo._steamroll(self)
+
+    def _transform_geoms(
+            self,
+            geoms: 'rai.typing.Geoms',
+            ) -> 'rai.typing.Geoms':
+        """
+        Apply this proxy's lmap and transform to a geoms dict.
+        Every geom in the result is a new array,
+        even if the transform is the identity.
+        """
+        # Accumulate rather than assign,
+        # since the lmap may send several layers to the same one
+        transformed: 'defaultdict[str, list]' = defaultdict(list)
+        for layer, layer_geoms in geoms.items():
+            transformed[self.lmap[layer]].extend(
+                self.transform.transform_xyarrays(layer_geoms)
+                )
+
+        return dict(transformed)
 
     def get_flat_transform(self, maxdepth: int = -1) -> 'rai.typing.Transform':
         if maxdepth == 0 or isinstance(self.compo, rai.Compo):
@@ -110,14 +143,7 @@ class Proxy:
 
     @property
     def geoms(self) -> 'rai.typing.Geoms':
-        return {
-            self.lmap[layer]: [
-                self.transform.transform_xyarray(geom)
-                for geom in geoms
-                ]
-            for layer, geoms
-            in self.compo.geoms.items()
-            }
+        return self._transform_geoms(self.compo.geoms)
 
     @property
     def subcompos(self) -> rai.SubcompoContainer:
@@ -284,9 +310,11 @@ class Proxy:
     @property
     def bbox(self) -> 'rai.typing.BBox':
         bbox = rai.BBox(proxy=self)
-        for geoms in self.steamroll().values():
-            for geom in geoms:
-                bbox.add_xyarray(geom)
+        bbox.add_xyarrays([
+            geom
+            for geoms in self.steamroll().values()
+            for geom in geoms
+            ])
         return bbox
 
     # snapping functions #
@@ -1,5 +1,16 @@
+import numpy as np
+
 import raimad as rai
 
+# Corners of a rectangle of unit length and width centered on the origin,
+# counterclockwise from the bottom left
+_UNIT_RECT = np.array([
+    [-0.5, -0.5],
+    [+0.5, -0.5],
+    [+0.5, +0.5],
+    [-0.5, +0.5],
+    ])
+
 class RectLW(rai.Compo):
     """
     RectLW
@@ -17,13 +28,5 @@ class RectLW(rai.Compo):
         self.width = width
 
         self.geoms.update({
-            'root': [
-                [
-                    [- length / 2, - width / 2],
-                    [+ length / 2, - width / 2],
-                    [+ length / 2, + width / 2],
-                    [- length / 2, + width / 2],
-                    ]
-                ]
+            'root': [_UNIT_RECT * (length, width)]
             })
-
@@ -1,5 +1,3 @@
-from copy import deepcopy
-
 try:
     from typing import Self
 except ImportError:
@@ -9,11 +7,19 @@ except ImportError:
 import numpy as np
 import raimad as rai
 
+# Plain nested lists,
+# since comparing those is several times faster than `np.array_equal`
+_IDENTITY = np.identity(3).tolist()
+
 class Transform:
     """
     Transformation: container for affine matrix
     """
 
+    # Every proxy owns a transform,
+    # and new ones are made whenever a proxy is copied
+    __slots__ = ('_affine', )
+
     _affine: 'rai.typing.Affine'
 
     def __init__(self) -> None:
@@ -31,6 +37,24 @@ class Transform:
         """
         return rai.affine.transform_xyarray(self._affine, poly)
 
+    def transform_xyarrays(
+            self,
+            polys: 'rai.typing.Polys',
+            ) -> 'list[rai.typing.PolyArray]':
+        """
+        Apply transformation to many xyarrays and return
+        a list of new transformed xyarrays
+        """
+        if self.is_identity():
+            # Copying is much cheaper than multiplying by the identity,
+            # and still hands back new arrays, like the general case
+            return [
+                np.array(poly, dtype=np.float64).reshape(-1, 2)
+                for poly in polys
+                ]
+
+        return rai.affine.transform_xyarrays(self._affine, polys)
+
     def transform_point(self, point: 'rai.typing.Point') -> 'pc.typing.Point':
         """
         Apply transformation to point and return new transformed point
@@ -57,6 +81,12 @@ class Transform:
     def get_scale(self) -> tuple[np.float64, np.float64]:
         return rai.affine.get_scale(self._affine)
 
+    def is_identity(self) -> bool:
+        """
+        Check whether this transform leaves every point where it is
+        """
+        return self._affine.tolist() == _IDENTITY
+
     def does_translate(self) -> bool:
         norm = np.linalg.norm(self.get_translation())
         return norm > 0.001  # TODO epsilon
@@ -101,7 +131,11 @@ class Transform:
             ))
 
     def copy(self) -> Self:
-        return deepcopy(self)
+        # The affine matrix is the only state,
+        # so there's no need to go through `deepcopy`
+        new = type(self).__new__(type(self))
+        new._affine = self._affine.copy()
+        return new
 
     # TODO typing.point
     # types defined in own files
@@ -1,4 +1,5 @@
 import unittest
+import unittest.mock
 
 import numpy as np
 
@@ -275,6 +276,110 @@ class TestBBox(ArrayAlmostEqual, unittest.TestCase, decimal=2):
             np.array([-2, -3, 1, 1])
             )
 
+    def test_bbox_python_numbers(self):
+        for xyarray, number_type in (
+                (np.array([[0, 0], [2, 3]]), int),
+                (np.array([[0., 0.], [2., 3.]]), float),
+                ):
+            bbox = rai.BBox(xyarray)
+            for value in (
+                    bbox.min_x, bbox.min_y, bbox.max_x, bbox.max_y,
+                    bbox.left, bbox.top, bbox.right, bbox.bottom,
+                    bbox.length, bbox.width,
+                    ):
+                self.assertIs(type(value), number_type)
+
+        self.assertEqual(repr(rai.BBox([[0., 0.]]).left), '0.0')
+
+    def test_bbox_array(self):
+        bbox = rai.BBox(np.array([[0., 1.], [2., 3.]]))
+
+        view = np.asarray(bbox)
+        self.assertIs(np.asarray(bbox), view)
+        self.assertFalse(view.flags.writeable)
+        self.assertIs(np.array(bbox, copy=False), view)
+
+        copied = np.array(bbox)
+        self.assertIsNot(copied, view)
+        self.assertTrue(copied.flags.writeable)
+
+        self.assertEqual(np.asarray(bbox, dtype=np.int64).dtype, np.int64)
+        with self.assertRaises(ValueError):
+            np.array(bbox, dtype=np.int64, copy=False)
+
+        bbox.add_point((5, 5))
+        self.assertArrayAlmostEqual(np.asarray(bbox), np.array([0, 1, 5, 5]))
+        self.assertArrayAlmostEqual(view, np.array([0, 1, 2, 3]))
+
+        # The dtype follows the extrema
+        self.assertEqual(view.dtype, np.float64)
+        int_bbox = rai.BBox(np.array([[0, 1], [2, 3]]))
+        self.assertEqual(np.asarray(int_bbox).dtype.kind, 'i')
+        self.assertEqual(np.asarray(int_bbox).tolist(), [0, 1, 2, 3])
+        self.assertArrayAlmostEqual(int_bbox.mid, (1, 2))
+
+    def test_bbox_xyarray(self):
+        bbox = rai.BBox()
+
+        bbox.add_xyarray(np.empty((0, 2)))
+        self.assertTrue(bbox.is_empty())
+
+        bbox.add_xyarray([[0, 1], [4, -2], [-3, 5]])
+        self.assertArrayAlmostEqual(
+            bbox,
+            np.array([-3, -2, 4, 5])
+            )
+
+        bbox.add_xyarray(np.array([[1, 1], [2, 2]]))
+        self.assertArrayAlmostEqual(
+            bbox,
+            np.array([-3, -2, 4, 5])
+            )
+
+        bbox.add_xyarray(np.array([[10, -10]]))
+        self.assertArrayAlmostEqual(
+            bbox,
+            np.array([-3, -10, 10, 5])
+            )
+
+    def test_bbox_xyarrays(self):
+        xyarrays = [
+            np.array([[0, 1], [4, -2]]),
+            [],
+            [[-3, 5], [1, 1]],
+            ]
+
+        bbox = rai.BBox()
+        bbox.add_xyarrays(xyarrays)
+        self.assertArrayAlmostEqual(bbox, np.array([-3, -2, 4, 5]))
+
+        bbox = rai.BBox()
+        bbox.add_xyarrays([])
+        self.assertTrue(bbox.is_empty())
+
+        # Force the per-xyarray reduction path
+        with unittest.mock.patch('raimad.bbox._CONCAT_MAX_POINTS', 0):
+            bbox = rai.BBox()
+            bbox.add_xyarrays(xyarrays)
+            self.assertArrayAlmostEqual(bbox, np.array([-3, -2, 4, 5]))
+
+    def test_bbox_corners_update(self):
+        bbox = rai.BBox(np.array([[0, 0], [2, 2]]))
+        self.assertArrayAlmostEqual(bbox.top_right, (2, 2))
+        self.assertArrayAlmostEqual(bbox.mid, (1, 1))
+
+        bbox.add_point((4, 6))
+        self.assertArrayAlmostEqual(bbox.top_right, (4, 6))
+        self.assertArrayAlmostEqual(bbox.mid, (2, 3))
+
+        bbox.add_xyarray(np.array([[-4, -6]]))
+        self.assertArrayAlmostEqual(bbox.bot_left, (-4, -6))
+        self.assertArrayAlmostEqual(bbox.mid, (0, 0))
+
+        padded = bbox.pad(1)
+        self.assertArrayAlmostEqual(padded.bot_left, (-5, -7))
+        self.assertArrayAlmostEqual(bbox.bot_left, (-4, -6))
+
     def test_bbox_snapping(self):
         c1 = rai.Proxy(rai.Circle(10))
         c2 = rai.Proxy(rai.Circle(5))
@@ -66,6 +66,64 @@ class TestCIFNoReuse(GeomsEqual, unittest.TestCase):
                 }
             )
 
+    def test_cif_noreuse_string(self):
+        """
+        Check the exact CIF output, without going through a parser
+        """
+        class Nested(rai.Compo):
+            def _make(self):
+                self.geoms.update({'a': [[[0, 0], [1.5, 0], [-1.5, -0.5]]]})
+                self.subcompos.append(
+                    rai.RectLW(10, 20).proxy().map('b').move(5, 10)
+                    )
+                # Degenerate annular sector: one empty polygon
+                self.subcompos.append(
+                    rai.AnSec(r1=5, r2=5, theta1=0, theta2=1)
+                    )
+
+        exporter = rai.cif.NoReuse(
+            Nested(),
+            multiplier=1,
+            )
+
+        self.assertEqual(
+            exporter.cif_string,
+            'DS 1 1 1;\n'
+            '\tL La;\n'
+            '\tP 0 0 1 0 -1 0 ;\n'
+            '\tC 2;\n'
+            '\tC 3;\n'
+            'DF;\n'
+            'DS 2 1 1;\n'
+            '\tL Lb;\n'
+            '\tP 0 0 10 0 10 20 0 20 ;\n'
+            'DF;\n'
+            'DS 3 1 1;\n'
+            '\tL Lroot;\n'
+            '\tP ;\n'
+            'DF;\n'
+            'C 1;\n'
+            'E'
+            )
+
+    def test_cif_noreuse_nonfinite(self):
+        """
+        """
+        class Weird(rai.Compo):
+            def _make(self, value):
+                self.geoms.update({'root': [[[0, 0], [value, 1], [1, 0]]]})
+
+        with self.assertRaises(ValueError):
+            rai.cif.NoReuse(Weird(float('nan')))
+
+        with self.assertRaises(OverflowError):
+            rai.cif.NoReuse(Weird(float('inf')))
+
+        self.assertIn(
+            '\tP 0 0 100000000000000000000 1 1 0 ;\n',
+            rai.cif.NoReuse(Weird(1e20), multiplier=1).cif_string,
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
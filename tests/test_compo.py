@@ -66,6 +66,54 @@ class TestCompo(unittest.TestCase):
         # Test two polys on the top lyaer
         self.assertEqual(len(geom['lower']), 2)
 
+    def test_steamroll_nested_proxies(self):
+        compo = BareGeometric()
+        proxy = compo.proxy().move(1, 0).proxy().scale(2).map('outer')
+        geom = proxy.steamroll()
+
+        self.assertEqual(geom.keys(), {'outer'})
+        self.assertEqual(len(geom['outer']), 2)
+
+        # Inner transform first, outer transform second
+        self.assertEqual(list(geom['outer'][0][2]), [22, 20])
+
+    def test_steamroll_identity_proxy(self):
+        compo = BareGeometric()
+        geoms = rai.Proxy(compo, {'root': 'other'}).steamroll()
+        self.assertEqual(geoms.keys(), {'other'})
+        self.assertIsNot(geoms['other'], compo.geoms['root'])
+        self.assertEqual(len(geoms['other']), 2)
+
+        # Identity proxies still hand back new arrays
+        proxy = rai.Proxy(compo)
+        proxy.geoms['root'][0][0, 0] = 99
+        proxy.steamroll()['root'][0][0, 0] = 99
+        self.assertEqual(compo.geoms['root'][0][0, 0], 0)
+
+    def test_steamroll_does_not_mutate(self):
+        class Mixed(rai.Compo):
+            def _make(self):
+                self.geoms.update({'root': [[[0, 0], [1, 0], [0, 1]]]})
+                self.subcompos.append(BareGeometric())
+
+        compo = Mixed()
+        self.assertEqual(len(compo.steamroll()['root']), 3)
+        self.assertEqual(len(compo.steamroll()['root']), 3)
+        self.assertEqual(len(compo.geoms['root']), 1)
+
+    def test_lmap_merges_layers(self):
+        class TwoLayers(rai.Compo):
+            def _make(self):
+                self.geoms.update({
+                    'a': [[[0, 0], [1, 0], [0, 1]]],
+                    'b': [[[5, 5], [6, 5], [5, 6]]],
+                    })
+
+        proxy = rai.Proxy(TwoLayers(), 'z')
+
+        for geom in (proxy.geoms, proxy.steamroll()):
+            self.assertEqual(geom.keys(), {'z'})
+            self.assertEqual(len(geom['z']), 2)
 
 if __name__ == '__main__':
     unittest.main()
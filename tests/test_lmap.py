@@ -141,6 +141,23 @@ class TestLMap(unittest.TestCase):
         self.assertEqual(below['syn'], 'nack')
         self.assertEqual(below['yin'], 'yang')
 
+    def test_lmap_compose_copy(self):
+        """
+        """
+        original = rai.LMap({'ayy': 'lmao', 'foo': 'bar'})
+        copied = original.copy()
+        copied.compose(rai.LMap({'bar': 'baz'}))
+
+        self.assertEqual(copied['foo'], 'baz')
+        self.assertEqual(original['foo'], 'bar')
+
+    def test_lmap_is_identity(self):
+        """
+        """
+        self.assertTrue(rai.LMap(None).is_identity())
+        self.assertFalse(rai.LMap('theonelayer').is_identity())
+        self.assertFalse(rai.LMap({'root': 'root'}).is_identity())
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -165,6 +165,13 @@ class TestMarks(ArrayAlmostEqual, unittest.TestCase, decimal=3):
             (20 - 3, 40 - 3)
             )
 
+    def test_marks_private_attrs(self):
+        compo = BareStructuralSyntax()
+
+        # Private and dunder probes are not treated as mark lookups
+        self.assertFalse(hasattr(compo.marks, '__deepcopy__'))
+        self.assertFalse(hasattr(compo.subcompos[2].marks, '_repr_html_'))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -73,6 +73,63 @@ class TestCompo(unittest.TestCase):
         self.assertEqual(list(geoms_0['upper'][0][2]), [20, 20])
         self.assertEqual(list(geoms_1['lower'][0][2]), [5, 5])
 
+    def test_transform_xyarrays(self):
+        transform = rai.Transform().rotate(0.3).move(1, -2).scale(2)
+        polys = [
+            [[0, 0], [0, 10], [10, 10], [10, 0]],
+            np.array([[20, 20], [40, 20], [30, 40]]),
+            ]
+
+        batched = transform.transform_xyarrays(polys)
+
+        self.assertEqual(len(batched), 2)
+        for actual, poly in zip(batched, polys):
+            np.testing.assert_array_almost_equal(
+                actual,
+                transform.transform_xyarray(poly),
+                )
+
+        self.assertEqual(transform.transform_xyarrays([]), [])
+
+        # Empty xyarrays come out as (0, 2),
+        # through the identity and the general path alike
+        for each in (rai.Transform(), transform):
+            self.assertEqual(
+                [poly.shape for poly in each.transform_xyarrays([[], []])],
+                [(0, 2), (0, 2)],
+                )
+
+        # A lone xyarray skips the stacking
+        lone = transform.transform_xyarrays(polys[1:])
+        self.assertEqual(len(lone), 1)
+        np.testing.assert_array_almost_equal(
+            lone[0],
+            transform.transform_xyarray(polys[1]),
+            )
+
+    def test_is_identity(self):
+        self.assertTrue(rai.Transform().is_identity())
+        self.assertTrue(rai.Transform().move(1, 2).move(-1, -2).is_identity())
+        self.assertFalse(rai.Transform().move(1, 0).is_identity())
+        self.assertFalse(rai.Transform().rotate(0.1).is_identity())
+
+    def test_copy(self):
+        transform = rai.Transform().move(1, 2)
+        copied = transform.copy()
+
+        self.assertIsInstance(copied, rai.Transform)
+        np.testing.assert_array_equal(copied._affine, transform._affine)
+
+        copied.move(3, 4)
+        np.testing.assert_array_almost_equal(
+            transform.get_translation(),
+            (1, 2)
+            )
+        np.testing.assert_array_almost_equal(
+            copied.get_translation(),
+            (4, 6)
+            )
+
     def test_walk_hier(self):
         mycompo = BareStructural()
         hier = list(mycompo.walk_hier())